@@ -14,8 +14,11 @@ from .const import (
     CONF_OFFICE_SITE_ID,
     CONF_DEVICE_TRACKER,
     CONF_OFFICE_DISTANCE,
+    DATA_TEAM_INDEX,
 )
 from .api import SignInAppApi
+from .team import TeamStatusIndex
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +57,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.services.async_register(DOMAIN, SERVICE_SIGN_IN, get_handle_sign_in(hass), schema=SERVICE_SCHEMA_SIGN_IN)
     hass.services.async_register(DOMAIN, SERVICE_SIGN_OUT, get_handle_sign_out(hass), schema=SERVICE_SCHEMA_SIGN_OUT)
 
+    # Shared status index for the team dashboard websocket subscription
+    hass.data[DATA_TEAM_INDEX] = TeamStatusIndex()
+    async_register_websocket_commands(hass)
+
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -73,13 +80,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_update_listener))
+
     return True
 
+async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply config entry changes to the running entry without reloading it."""
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None:
+        return
+
+    old_config = entry_data["config"]
+    entry_data["config"] = entry.data
+
+    api = entry_data["api"]
+    coordinator = entry_data.get("coordinator")
+
+    if entry.data[CONF_ACCESS_TOKEN] != api.token:
+        _LOGGER.debug("Applying new token to entry %s", entry.entry_id)
+        api.set_token(entry.data[CONF_ACCESS_TOKEN])
+        # Cached status belongs to the old token, so fetch it again
+        if coordinator:
+            await coordinator.async_request_refresh()
+        return
+
+    if any(
+        old_config.get(key) != entry.data.get(key)
+        for key in (CONF_REMOTE_SITE_ID, CONF_OFFICE_SITE_ID)
+    ):
+        _LOGGER.debug("Applying new site IDs to entry %s", entry.entry_id)
+        # The status mapping uses the site IDs, so re-evaluate the cached data
+        if coordinator:
+            coordinator.async_update_listeners()
+
+    # Tracker and distance changes are read from entry_data["config"] on the next service call
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DATA_TEAM_INDEX].async_remove(entry.entry_id)
 
     return unload_ok
 
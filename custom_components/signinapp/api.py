@@ -25,18 +25,29 @@ class SignInAppApi:
         self._session = session
         self._timezone = timezone
         self._token: Optional[str] = None
+        self._headers: Optional[Dict[str, str]] = None
+
+    @property
+    def token(self) -> Optional[str]:
+        """Return the current authentication token."""
+        return self._token
 
     def set_token(self, token: str):
-        """Set the authentication token."""
-        self._token = token
+        """Set the authentication token, rebuilding pooled headers on the next request."""
+        if token != self._token:
+            self._token = token
+            self._headers = None
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for requests."""
-        headers = HEADERS.copy()
-        headers["x-timezone"] = self._timezone
-        if self._token:
-            headers["authorization"] = f"Bearer {self._token}"
-        return headers
+        if self._headers is None:
+            headers = HEADERS.copy()
+            headers["x-timezone"] = self._timezone
+            if self._token:
+                headers["authorization"] = f"Bearer {self._token}"
+            self._headers = headers
+        # Callers may modify the returned dict (e.g. connect), so hand out a copy
+        return self._headers.copy()
 
     async def connect(self, code: str) -> str:
         """Exchange companion code for a token."""
@@ -10,3 +10,7 @@ CONF_OFFICE_DISTANCE = "office_distance"
 DEFAULT_OFFICE_DISTANCE = 50
 
 API_BASE_URL = "https://backend.signinapp.com/api/mobile"
+
+# hass.data key for the in-memory team status index (kept outside hass.data[DOMAIN],
+# which only holds config entries)
+DATA_TEAM_INDEX = f"{DOMAIN}_team_index"
@@ -4,7 +4,7 @@ import logging
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -13,7 +13,8 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from .const import DOMAIN, CONF_REMOTE_SITE_ID, CONF_OFFICE_SITE_ID
+from .const import DOMAIN, CONF_REMOTE_SITE_ID, CONF_OFFICE_SITE_ID, DATA_TEAM_INDEX
+from .team import build_team_record
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +50,9 @@ async def async_setup_entry(
 
     await coordinator.async_config_entry_first_refresh()
 
+    # Expose the coordinator so entry updates can be applied without a reload
+    hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
+
     async_add_entities([SignInAppSensor(coordinator, entry)], True)
 
 class SignInAppSensor(CoordinatorEntity, SensorEntity):
@@ -75,6 +79,28 @@ class SignInAppSensor(CoordinatorEntity, SensorEntity):
 
         self._attr_name = f"SignInApp {name}"
 
+    async def async_added_to_hass(self) -> None:
+        """Publish the initial status to the team index."""
+        await super().async_added_to_hass()
+        self._update_team_index()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_team_index()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_team_index(self) -> None:
+        """Push this account's status to the team index; unchanged records are ignored."""
+        data = self.coordinator.data or {}
+        returning_visitor = data.get("returningVisitor")
+        name = returning_visitor.get("name") if returning_visitor else None
+        self.hass.data[DATA_TEAM_INDEX].async_update(
+            self.entry.entry_id,
+            build_team_record(name, self.native_value, returning_visitor),
+        )
+
     @property
     def entity_picture(self):
         """Return the entity picture."""
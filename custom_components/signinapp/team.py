@@ -0,0 +1,69 @@
+"""In-memory team status index for Sign In App."""
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+TeamListener = Callable[[Dict[str, Dict[str, Any]], List[str]], None]
+
+
+class TeamStatusIndex:
+    """Keep the latest status of every account and notify subscribers of changes."""
+
+    def __init__(self):
+        """Initialize the index."""
+        self._accounts: Dict[str, Dict[str, Any]] = {}
+        self._listeners: List[TeamListener] = []
+
+    @callback
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of all known accounts."""
+        return {entry_id: dict(record) for entry_id, record in self._accounts.items()}
+
+    @callback
+    def async_update(self, entry_id: str, record: Dict[str, Any]) -> None:
+        """Store the record for an account, notifying listeners only if it changed."""
+        if self._accounts.get(entry_id) == record:
+            return
+        _LOGGER.debug("Team status changed for entry %s: %s", entry_id, record)
+        self._accounts[entry_id] = record
+        self._notify({entry_id: dict(record)}, [])
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Drop an account from the index."""
+        if self._accounts.pop(entry_id, None) is None:
+            return
+        _LOGGER.debug("Team status removed for entry %s", entry_id)
+        self._notify({}, [entry_id])
+
+    @callback
+    def async_subscribe(self, listener: TeamListener) -> CALLBACK_TYPE:
+        """Subscribe to changes; returns a function to unsubscribe."""
+        self._listeners.append(listener)
+
+        @callback
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def _notify(self, changed: Dict[str, Dict[str, Any]], removed: List[str]) -> None:
+        """Call every listener with the diff."""
+        for listener in list(self._listeners):
+            listener(changed, removed)
+
+
+def build_team_record(name: Optional[str], status: Optional[str], returning_visitor: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the compact record stored in the index for one account."""
+    returning_visitor = returning_visitor or {}
+    return {
+        "name": name,
+        "status": status,
+        "site_id": returning_visitor.get("siteId"),
+        "last_in": returning_visitor.get("lastIn"),
+        "last_out": returning_visitor.get("lastOut"),
+    }
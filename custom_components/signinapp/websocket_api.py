@@ -0,0 +1,40 @@
+"""Websocket API for Sign In App."""
+import logging
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_TEAM_INDEX
+
+_LOGGER = logging.getLogger(__name__)
+
+WS_TYPE_SUBSCRIBE_TEAM = "signinapp/subscribe_team"
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the Sign In App websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_team)
+
+@websocket_api.websocket_command({
+    vol.Required("type"): WS_TYPE_SUBSCRIBE_TEAM,
+})
+@callback
+def ws_subscribe_team(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict) -> None:
+    """Send a snapshot of every account's status, then only the accounts that change."""
+    index = hass.data[DATA_TEAM_INDEX]
+    msg_id = msg["id"]
+
+    @callback
+    def forward_changes(changed, removed):
+        """Forward a diff to the subscriber."""
+        event = {}
+        if changed:
+            event["changed"] = changed
+        if removed:
+            event["removed"] = removed
+        connection.send_message(websocket_api.event_message(msg_id, event))
+
+    connection.subscriptions[msg_id] = index.async_subscribe(forward_changes)
+    connection.send_result(msg_id)
+    connection.send_message(websocket_api.event_message(msg_id, {"snapshot": index.snapshot()}))